@@ -90,6 +90,23 @@ interface FileWithTime {
   mtime: number;
 }
 
+interface ImageFileInfo extends FileWithTime {
+  size: number;
+}
+
+interface DirectoryWatch {
+  watcher: fs.FSWatcher;
+  listeners: Set<() => void>;
+  debounceHandle: ReturnType<typeof setTimeout> | null;
+}
+
+interface DirectoryImageCount {
+  mtimeMs: number;
+  listedAt: number;
+  imageCount: number;
+  subdirectories: string[];
+}
+
 interface RenderJsonMap {
   num_instances: string;
   image_output_dir: string;
@@ -130,6 +147,12 @@ interface BrowseOptions {
   filters?: Electron.FileFilter[];
 }
 
+interface RenderPaths {
+  dazExecutable: string;
+  renderScript: string;
+  template: string;
+}
+
 // ============================================================================
 // CONSTANTS AND CONFIGURATION
 // ============================================================================
@@ -139,7 +162,7 @@ const LOG_SIZE_MB = 10;
 const LOG_SIZE_DAZ = '10m';
 
 // File extensions
-const IMAGE_EXTENSIONS: string[] = ['.png'];
+const IMAGE_EXTENSIONS: ReadonlySet<string> = new Set(['.png']);
 
 // Default paths
 const DEFAULT_OUTPUT_SUBDIR = 'Downloads/output';
@@ -165,8 +188,39 @@ const THEME_COLORS: Record<string, ThemeColors> = {
   }
 };
 
+// Precomputed theme switch script for each theme
+const THEME_BODY_CLASS_SCRIPTS: Record<'dark' | 'light', string> = {
+  light: `document.body.className = 'theme-light';`,
+  dark: `document.body.className = 'theme-dark';`
+};
+
 // Process names for monitoring
 const DAZ_STUDIO_PROCESSES: string[] = ['DAZStudio.exe'];
+const IRAY_SERVER_PROCESSES: string[] = ['iray_server.exe', 'iray_server_worker.exe'];
+const DAZ_STUDIO_PROCESS_SET = new Set(DAZ_STUDIO_PROCESSES);
+const IRAY_SERVER_PROCESS_SET = new Set(IRAY_SERVER_PROCESSES);
+const RENDER_PROCESSES: string[] = [...DAZ_STUDIO_PROCESSES, ...IRAY_SERVER_PROCESSES];
+
+// Quoted image name in each of taskkill's per-process report lines
+const TASKKILL_IMAGE_NAME_PATTERN = /"([^"]+)"/g;
+
+// Cleanup retries (delay doubles after each failed attempt)
+const CLEANUP_MAX_ATTEMPTS = 10;
+const CLEANUP_RETRY_BASE_DELAY_MS = 25;
+
+// Delay between launching successive DAZ Studio instances
+const INSTANCE_LAUNCH_STAGGER_MS = 5000;
+
+// Quiet period that collapses a burst of output directory events into one rescan
+const OUTPUT_WATCH_DEBOUNCE_MS = 100;
+
+// A cached folder listing is only trusted once the folder's mtime is older than
+// the listing by this much. Coarse timestamps (2 s on FAT32) mean a frame
+// written just after the listing can leave the mtime unchanged.
+const IMAGE_COUNT_MTIME_MARGIN_MS = 3000;
+
+// Full progress refresh while the output watcher is live, in case it dies silently
+const RENDER_PROGRESS_REFRESH_MS = 30000;
 
 // Validation limits
 const VALIDATION_LIMITS: ValidationLimits = {
@@ -180,16 +234,26 @@ const VALIDATION_LIMITS: ValidationLimits = {
 
 let mainWindow: BrowserWindow | null = null;
 let splashWindow: BrowserWindow | null = null;
-let splashStartTime: number | null = null;
 let tray: Tray | null = null;
 let isRendering = false;
 let initialTotalImages = 0;
 let sessionStartImageCount = 0;
 let renderStartTime: number | null = null;
+let pendingLaunchHandles: ReturnType<typeof setTimeout>[] = [];
 let periodicMonitoringHandle: ReturnType<typeof setInterval> | null = null;
 let fileWatcherHandle: ReturnType<typeof setInterval> | null = null;
+let renderMonitorDirectoryKey: string | null = null;
+let unwatchRenderOutput: (() => void) | null = null;
+let unwatchContinuousOutput: (() => void) | null = null;
 let currentImagePath: string | null = null;
 let currentTheme: 'dark' | 'light' = 'dark';
+let renderPaths: RenderPaths | null = null;
+
+// One recursive fs.watch per directory, shared by every monitor watching it
+const directoryWatches = new Map<string, DirectoryWatch>();
+
+// Image counts per folder, valid while the folder's mtime is unchanged
+const directoryImageCounts = new Map<string, DirectoryImageCount>();
 
 // ============================================================================
 // UTILITY FUNCTIONS
@@ -205,6 +269,11 @@ function getLocalAppDataPath(subfolder: string = APPDATA_SUBFOLDER): string {
   return path.join(localAppData, subfolder);
 }
 
+// Iray Server's working directory and the folder it writes finished renders
+// to; both derive from environment values that don't change while running
+const IRAY_SERVER_DIRECTORY = path.join(getLocalAppDataPath(), 'IrayServer');
+const IRAY_RESULTS_DIRECTORY = path.join(IRAY_SERVER_DIRECTORY, 'results', 'admin');
+
 function getDefaultOutputDirectory(): string {
   return path.join(os.homedir(), DEFAULT_OUTPUT_SUBDIR);
 }
@@ -223,19 +292,32 @@ function formatFileSize(sizeBytes: number): string {
   }
 }
 
+function isImageFile(fileName: string): boolean {
+  // Lowercase just the extension rather than every full file name scanned
+  return IMAGE_EXTENSIONS.has(path.extname(fileName).toLowerCase());
+}
+
+function toForwardSlashes(filePath: string): string {
+  return filePath.replace(/\\/g, '/');
+}
+
+function toForwardSlashesAll(filePaths: string[] | null | undefined): string[] {
+  return (filePaths || []).map(toForwardSlashes);
+}
+
 function normalizePathForLogging(filePath: string | null | undefined): string | null | undefined {
   if (filePath) {
-    return filePath.replace(/\\/g, '/');
+    return toForwardSlashes(filePath);
   }
   return filePath;
 }
 
+// When packaged with asar disabled, files are in resources/app/. Neither
+// location changes at runtime, so it is resolved once.
+const RESOURCE_BASE_PATH = app.isPackaged ? path.join(process.resourcesPath, 'app') : __dirname;
+
 function resourcePath(relativePath: string): string {
-  if (app.isPackaged) {
-    // When packaged with asar disabled, files are in resources/app/
-    return path.join(process.resourcesPath, 'app', relativePath);
-  }
-  return path.join(__dirname, relativePath);
+  return path.join(RESOURCE_BASE_PATH, relativePath);
 }
 
 function detectWindowsTheme(): 'dark' | 'light' {
@@ -249,51 +331,42 @@ function detectWindowsTheme(): 'dark' | 'light' {
 function setupLogger(): void {
   try {
     const logDir = getAppDataPath();
-    if (!fs.existsSync(logDir)) {
-      fs.mkdirSync(logDir, { recursive: true });
-    }
+    ensureDirectory(logDir);
     
     const logPath = path.join(logDir, 'log.txt');
     console.log(`--- Overlord started --- (log file: ${normalizePathForLogging(logPath)}, max size: ${LOG_SIZE_MB} MB)`);
     
     // Redirect console to file (simple implementation)
     const logStream = fs.createWriteStream(logPath, { flags: 'a', encoding: 'utf8' });
-    const originalLog = console.log;
-    const originalError = console.error;
-    const originalWarn = console.warn;
     
-    console.log = function(...args: unknown[]) {
-      const timestamp = new Date().toISOString();
-      const message = `${timestamp} INFO: ${args.join(' ')}\n`;
-      try {
-        logStream.write(message);
-      } catch (e) {
-        // Silently fail if log write fails
-      }
-      originalLog.apply(console, args);
+    // Lines logged in the same tick are corked and flushed as one write
+    let flushScheduled = false;
+    const flushLog = (): void => {
+      flushScheduled = false;
+      logStream.uncork();
     };
     
-    console.error = function(...args: unknown[]) {
-      const timestamp = new Date().toISOString();
-      const message = `${timestamp} ERROR: ${args.join(' ')}\n`;
-      try {
-        logStream.write(message);
-      } catch (e) {
-        // Silently fail if log write fails
-      }
-      originalError.apply(console, args);
+    const redirect = (level: string, original: (...args: unknown[]) => void) => {
+      return function(...args: unknown[]) {
+        const timestamp = new Date().toISOString();
+        const message = `${timestamp} ${level}: ${args.join(' ')}\n`;
+        try {
+          if (!flushScheduled) {
+            flushScheduled = true;
+            logStream.cork();
+            process.nextTick(flushLog);
+          }
+          logStream.write(message);
+        } catch (e) {
+          // Silently fail if log write fails
+        }
+        original.apply(console, args);
+      };
     };
     
-    console.warn = function(...args: unknown[]) {
-      const timestamp = new Date().toISOString();
-      const message = `${timestamp} WARNING: ${args.join(' ')}\n`;
-      try {
-        logStream.write(message);
-      } catch (e) {
-        // Silently fail if log write fails
-      }
-      originalWarn.apply(console, args);
-    };
+    console.log = redirect('INFO', console.log);
+    console.error = redirect('ERROR', console.error);
+    console.warn = redirect('WARNING', console.warn);
   } catch (error) {
     // If logger setup fails, continue without file logging
     console.error('Failed to setup logger:', error);
@@ -305,11 +378,26 @@ function setupLogger(): void {
 // FILE AND JSON UTILITIES
 // ============================================================================
 
+// Directories this session has already created or confirmed
+const ensuredDirectories = new Set<string>();
+
+function ensureDirectory(directory: string): void {
+  /**
+   * Create a directory (and parents) unless this session already has.
+   * Only for Overlord's own folders, which nothing else removes.
+   */
+  if (ensuredDirectories.has(directory)) {
+    return;
+  }
+  fs.mkdirSync(directory, { recursive: true });
+  ensuredDirectories.add(directory);
+}
+
 function getFramesFromAnimationFile(animationFilepath: string): number {
   const defaultFrames = 1;
   
   try {
-    if (!animationFilepath || !fs.existsSync(animationFilepath)) {
+    if (!animationFilepath) {
       console.warn(`Animation file not found: ${normalizePathForLogging(animationFilepath)}. Using default of ${defaultFrames} frame.`);
       return defaultFrames;
     }
@@ -337,8 +425,13 @@ function getFramesFromAnimationFile(animationFilepath: string): number {
       return defaultFrames;
     }
   } catch (error) {
-    const err = error as Error;
-    console.error(`Error reading animation file ${normalizePathForLogging(animationFilepath)}: ${err.message}. Using default of ${defaultFrames} frame.`);
+    const err = error as NodeJS.ErrnoException;
+    // Read without an existence check first; a missing file surfaces here
+    if (err.code === 'ENOENT') {
+      console.warn(`Animation file not found: ${normalizePathForLogging(animationFilepath)}. Using default of ${defaultFrames} frame.`);
+    } else {
+      console.error(`Error reading animation file ${normalizePathForLogging(animationFilepath)}: ${err.message}. Using default of ${defaultFrames} frame.`);
+    }
     return defaultFrames;
   }
 }
@@ -347,7 +440,7 @@ function getAnglesFromSubjectFile(subjectFilepath: string): number {
   const defaultAngles = 16;
   
   try {
-    if (!subjectFilepath || !fs.existsSync(subjectFilepath)) {
+    if (!subjectFilepath) {
       console.warn(`Subject file not found: ${normalizePathForLogging(subjectFilepath)}. Using default of ${defaultAngles} angles.`);
       return defaultAngles;
     }
@@ -366,8 +459,12 @@ function getAnglesFromSubjectFile(subjectFilepath: string): number {
     console.warn(`Number of angles not found in the JSON for ${normalizePathForLogging(subjectFilepath)}. Using default value of ${defaultAngles} angles.`);
     return defaultAngles;
   } catch (error) {
-    const err = error as Error;
-    console.error(`Error reading subject file ${normalizePathForLogging(subjectFilepath)}: ${err.message}. Using default of ${defaultAngles} angles.`);
+    const err = error as NodeJS.ErrnoException;
+    if (err.code === 'ENOENT') {
+      console.warn(`Subject file not found: ${normalizePathForLogging(subjectFilepath)}. Using default of ${defaultAngles} angles.`);
+    } else {
+      console.error(`Error reading subject file ${normalizePathForLogging(subjectFilepath)}: ${err.message}. Using default of ${defaultAngles} angles.`);
+    }
     return defaultAngles;
   }
 }
@@ -419,26 +516,46 @@ function calculateTotalImages(
   return totalImages;
 }
 
-function findNewestImage(directory: string): string[] {
-  const imageFiles: FileWithTime[] = [];
-  const maxFiles = 100;
+function isDirectoryEntry(entry: fs.Dirent, entryPath: string): boolean {
+  /**
+   * Whether a directory entry is a folder to descend into. Dirents report
+   * symlinked folders and junctions as links, so those cost one stat to follow.
+   */
+  if (entry.isDirectory()) {
+    return true;
+  }
+  if (!entry.isSymbolicLink()) {
+    return false;
+  }
+  try {
+    return fs.statSync(entryPath).isDirectory();
+  } catch (error) {
+    return false; // Broken link
+  }
+}
+
+function walkImageFiles(directory: string, visit: (filePath: string, stat: fs.Stats) => void): void {
+  /**
+   * Call `visit` with the path and stat of every image under a directory.
+   * Directory entries carry their type, so only image files (and symlinks)
+   * are stat'ed, and the walk uses an explicit stack rather than recursion.
+   */
+  const pending: string[] = [directory];
   
-  function walkDir(dir: string): void {
+  while (pending.length > 0) {
+    const dir = pending.pop() as string;
+    
     try {
-      const files = fs.readdirSync(dir);
-      
-      for (const file of files) {
-        const filePath = path.join(dir, file);
-        const stat = fs.statSync(filePath);
+      for (const entry of fs.readdirSync(dir, { withFileTypes: true })) {
+        const entryPath = path.join(dir, entry.name);
         
-        if (stat.isDirectory()) {
-          walkDir(filePath);
-        } else if (IMAGE_EXTENSIONS.some(ext => file.toLowerCase().endsWith(ext))) {
-          imageFiles.push({ path: filePath, mtime: stat.mtime.getTime() });
-          
-          if (imageFiles.length > maxFiles * 2) {
-            imageFiles.sort((a, b) => b.mtime - a.mtime);
-            imageFiles.splice(maxFiles);
+        if (isDirectoryEntry(entry, entryPath)) {
+          pending.push(entryPath);
+        } else if (isImageFile(entry.name)) {
+          try {
+            visit(entryPath, fs.statSync(entryPath));
+          } catch (error) {
+            // The file was removed between listing and stat
           }
         }
       }
@@ -446,11 +563,42 @@ function findNewestImage(directory: string): string[] {
       // Ignore errors for inaccessible directories
     }
   }
+}
+
+function insertNewest<T extends FileWithTime>(files: T[], file: T, limit: number): void {
+  /**
+   * Insert a file into a list kept sorted newest first, holding at most
+   * `limit` entries. Older files that wouldn't make the cut are dropped
+   * without growing the list.
+   */
+  if (files.length >= limit && file.mtime <= files[files.length - 1].mtime) {
+    return;
+  }
   
-  walkDir(directory);
-  imageFiles.sort((a, b) => b.mtime - a.mtime);
+  let index = files.length;
+  while (index > 0 && files[index - 1].mtime < file.mtime) {
+    index--;
+  }
+  
+  files.splice(index, 0, file);
+  if (files.length > limit) {
+    files.pop();
+  }
+}
+
+function findNewestImage(directory: string, maxFiles: number = 8): ImageFileInfo[] {
+  /**
+   * Return the newest images under a directory, newest first. Size and mtime
+   * come from the walk's own stat, so callers don't need to stat again. Only
+   * the top `maxFiles` are kept while walking, rather than sorting every image.
+   */
+  const imageFiles: ImageFileInfo[] = [];
   
-  return imageFiles.slice(0, maxFiles).map(f => f.path);
+  walkImageFiles(directory, (filePath, stat) => {
+    insertNewest(imageFiles, { path: filePath, mtime: stat.mtime.getTime(), size: stat.size }, maxFiles);
+  });
+  
+  return imageFiles;
 }
 
 function calculateAverageRenderTime(directory: string, maxFiles: number = 10): number | null {
@@ -463,68 +611,41 @@ function calculateAverageRenderTime(directory: string, maxFiles: number = 10): n
       return null;
     }
     
-    // Get all image files with their modification times
-    const filesWithTimes: FileWithTime[] = [];
+    // Keep only the most recent image files (up to maxFiles), newest first
+    const recentFiles: FileWithTime[] = [];
     
-    function walkDir(dir: string): void {
-      try {
-        const files = fs.readdirSync(dir);
-        
-        for (const file of files) {
-          const filePath = path.join(dir, file);
-          const stat = fs.statSync(filePath);
-          
-          if (stat.isDirectory()) {
-            walkDir(filePath);
-          } else if (IMAGE_EXTENSIONS.some(ext => file.toLowerCase().endsWith(ext))) {
-            const mtime = stat.mtime.getTime() / 1000; // Convert to seconds
-            
-            // Only include files modified after render started
-            if (renderStartTime && mtime < renderStartTime / 1000) {
-              continue;
-            }
-            
-            filesWithTimes.push({ path: filePath, mtime: mtime });
-          }
-        }
-      } catch (error) {
-        // Ignore errors for inaccessible directories
+    walkImageFiles(directory, (filePath, stat) => {
+      const mtime = stat.mtime.getTime() / 1000; // Convert to seconds
+      
+      // Only include files modified after render started
+      if (renderStartTime && mtime < renderStartTime / 1000) {
+        return;
       }
-    }
-    
-    walkDir(directory);
-    
-    if (filesWithTimes.length < 2) {
-      return null; // Need at least 2 files to calculate intervals
-    }
-    
-    // Sort by modification time (newest first)
-    filesWithTimes.sort((a, b) => b.mtime - a.mtime);
-    
-    // Take the most recent files (up to maxFiles)
-    const recentFiles = filesWithTimes.slice(0, maxFiles);
+      
+      insertNewest(recentFiles, { path: filePath, mtime: mtime }, maxFiles);
+    });
     
     if (recentFiles.length < 2) {
-      return null;
+      return null; // Need at least 2 files to calculate intervals
     }
     
-    // Calculate time intervals between consecutive files
-    const intervals: number[] = [];
+    // The list is sorted newest first, so consecutive intervals are never
+    // negative and the positive ones sum to newest minus oldest. Only the
+    // number of positive intervals (files that didn't share a timestamp)
+    // needs counting.
+    let positiveIntervals = 0;
     for (let i = 0; i < recentFiles.length - 1; i++) {
-      const newerTime = recentFiles[i].mtime;
-      const olderTime = recentFiles[i + 1].mtime;
-      const interval = newerTime - olderTime;
-      if (interval > 0) { // Only include positive intervals
-        intervals.push(interval);
+      if (recentFiles[i].mtime > recentFiles[i + 1].mtime) {
+        positiveIntervals++;
       }
     }
     
-    if (intervals.length === 0) {
+    if (positiveIntervals === 0) {
       return null;
     }
     
     // Return average interval in seconds
-    return intervals.reduce((a, b) => a + b, 0) / intervals.length;
+    return (recentFiles[0].mtime - recentFiles[recentFiles.length - 1].mtime) / positiveIntervals;
     
   } catch (error) {
     console.error('Error calculating average render time:', error);
@@ -532,73 +653,89 @@ function calculateAverageRenderTime(directory: string, maxFiles: number = 10): n
   }
 }
 
+async function removeWithRetry(targetPath: string): Promise<boolean> {
+  /**
+   * Recursively remove a file or directory, retrying with exponential
+   * backoff while another process still holds a handle on it.
+   * Returns false if it could not be removed.
+   */
+  for (let attempt = 0; ; attempt++) {
+    try {
+      await fs.promises.rm(targetPath, { recursive: true, force: true });
+      return true;
+    } catch (error) {
+      if (attempt >= CLEANUP_MAX_ATTEMPTS - 1) {
+        const err = error as Error;
+        console.error(`Failed to remove ${normalizePathForLogging(targetPath)}: ${err.message}`);
+        return false;
+      }
+      await new Promise<void>(resolve => setTimeout(resolve, CLEANUP_RETRY_BASE_DELAY_MS * 2 ** attempt));
+    }
+  }
+}
+
 // ============================================================================
 // PROCESS MANAGEMENT
 // ============================================================================
 
-async function killProcessesByName(processNames: string[]): Promise<number> {
-  let killedCount = 0;
+async function killProcessesByName(processNames: string[]): Promise<string[]> {
+  /**
+   * Terminate all processes matching any of the given image names with a
+   * single taskkill call. Returns the names that had a process terminated.
+   */
+  if (processNames.length === 0) {
+    return [];
+  }
   
-  for (const processName of processNames) {
-    try {
-      await execPromise(`taskkill /F /IM ${processName}`);
-      console.log(`Killed process: ${processName}`);
-      killedCount++;
-    } catch (error) {
-      // Process might not be running
-    }
+  const command = `taskkill /F ${processNames.map(processName => `/IM ${processName}`).join(' ')}`;
+  let output = '';
+  
+  try {
+    const { stdout } = await execPromise(command);
+    output = stdout;
+  } catch (error) {
+    // taskkill exits with an error if any of the names is not running,
+    // but still reports every process it did terminate on stdout
+    output = (error as { stdout?: string }).stdout || '';
   }
   
-  return killedCount;
+  // Single scan of the output instead of one substring search per name
+  const terminated = new Set<string>();
+  for (const match of output.matchAll(TASKKILL_IMAGE_NAME_PATTERN)) {
+    terminated.add(match[1].toLowerCase());
+  }
+  
+  const killed = processNames.filter(processName =>
+    terminated.has(processName.toLowerCase())
+  );
+  
+  for (const processName of killed) {
+    console.log(`Killed process: ${processName}`);
+  }
+  
+  return killed;
 }
 
-async function stopIrayServer(): Promise<number> {
+async function stopIrayServer(killed: string[]): Promise<number> {
   try {
     console.log('Stopping Iray Server using Node.js native process management');
     
-    // Kill Iray Server processes
-    const irayProcessNames = ['iray_server.exe', 'iray_server_worker.exe'];
-    let killedCount = 0;
+    // The processes were already killed in the caller's combined taskkill pass
+    const killedCount = killed.length;
     
-    for (const processName of irayProcessNames) {
-      try {
-        await execPromise(`taskkill /F /IM ${processName}`);
-        console.log(`Killed Iray Server process: ${processName}`);
-        killedCount++;
-      } catch (error) {
-        // Process might not be running (taskkill returns error if process not found)
+    for (const processName of IRAY_SERVER_PROCESSES) {
+      if (!killed.includes(processName)) {
         console.log(`No ${processName} process found`);
       }
     }
     
-    // Wait a moment for processes to fully terminate
-    if (killedCount > 0) {
-      console.log('Waiting for processes to fully terminate...');
-      await new Promise<void>(resolve => setTimeout(resolve, 2000));
-    }
+    // Clean up Iray Server directory. No fixed wait for the killed processes
+    // to exit: removeWithRetry backs off while they still hold file handles.
+    // rm with force is a no-op for a missing directory, so no existence check is needed
+    console.log(`Cleaning Iray Server directory: ${normalizePathForLogging(IRAY_SERVER_DIRECTORY)}`);
     
-    // Clean up Iray Server directory
-    const irayServerDir = path.join(getLocalAppDataPath(), 'IrayServer');
-    
-    if (fs.existsSync(irayServerDir)) {
-      console.log(`Cleaning Iray Server directory: ${normalizePathForLogging(irayServerDir)}`);
-      
-      try {
-        // Use Node.js built-in recursive removal with retry logic
-        fs.rmSync(irayServerDir, { 
-          recursive: true, 
-          force: true, 
-          maxRetries: 10, 
-          retryDelay: 1000 
-        });
-        console.log('Iray Server directory cleaned successfully');
-      } catch (error) {
-        const err = error as Error;
-        console.error(`Failed to clean Iray Server directory: ${err.message}`);
-        // Try to continue anyway
-      }
-    } else {
-      console.log('Iray Server directory does not exist, nothing to clean');
+    if (await removeWithRetry(IRAY_SERVER_DIRECTORY)) {
+      console.log('Iray Server directory cleaned successfully');
     }
     
     console.log(`Iray Server stopped successfully (${killedCount} processes terminated)`);
@@ -613,9 +750,12 @@ async function stopIrayServer(): Promise<number> {
 async function stopAllRenderProcesses(): Promise<StopResults> {
   console.log('Stopping all render-related processes (DAZStudio, Iray Server)');
   
+  // One taskkill pass for both process groups, routed back by name
+  const killed = await killProcessesByName(RENDER_PROCESSES);
+  
   const results: StopResults = {
-    daz_studio: await killProcessesByName(DAZ_STUDIO_PROCESSES),
-    iray_server: await stopIrayServer()
+    daz_studio: killed.filter(processName => DAZ_STUDIO_PROCESS_SET.has(processName)).length,
+    iray_server: await stopIrayServer(killed.filter(processName => IRAY_SERVER_PROCESS_SET.has(processName)))
   };
   
   const total = results.daz_studio + results.iray_server;
@@ -632,6 +772,9 @@ class SettingsManager {
   settingsDir: string;
   settingsFile: string;
   defaultSettings: AppSettings;
+  private pendingSettings: AppSettings | null = null;
+  private queuedSettings: AppSettings | null = null;
+  private activeWrite: Promise<boolean> | null = null;
 
   constructor() {
     this.settingsDir = getAppDataPath();
@@ -661,44 +804,77 @@ class SettingsManager {
       }
     };
     
-    if (!fs.existsSync(this.settingsDir)) {
-      fs.mkdirSync(this.settingsDir, { recursive: true });
-    }
+    ensureDirectory(this.settingsDir);
   }
   
   loadSettings(): AppSettings {
+    // Settings still being written are newer than what is on disk
+    if (this.queuedSettings) {
+      return { ...this.defaultSettings, ...this.queuedSettings };
+    }
+    
     try {
-      if (fs.existsSync(this.settingsFile)) {
-        const data = fs.readFileSync(this.settingsFile, 'utf8');
-        const settings = JSON.parse(data) as Partial<AppSettings>;
-        const merged: AppSettings = { ...this.defaultSettings, ...settings };
-        console.log('Settings loaded from', this.settingsFile);
-        return merged;
-      } else {
+      const data = fs.readFileSync(this.settingsFile, 'utf8');
+      const settings = JSON.parse(data) as Partial<AppSettings>;
+      const merged: AppSettings = { ...this.defaultSettings, ...settings };
+      console.log('Settings loaded from', this.settingsFile);
+      return merged;
+    } catch (error) {
+      const err = error as NodeJS.ErrnoException;
+      if (err.code === 'ENOENT') {
         console.log('No settings file found, using defaults');
+      } else {
+        console.warn('Failed to load settings:', err.message, ', using defaults');
       }
-    } catch (error) {
-      const err = error as Error;
-      console.warn('Failed to load settings:', err.message, ', using defaults');
     }
     
     return { ...this.defaultSettings };
   }
   
-  saveSettings(settings: AppSettings): boolean {
-    try {
-      const issues = this.validateSettings(settings);
-      if (issues.length > 0) {
-        console.warn('Settings validation warnings:', issues);
+  saveSettings(settings: AppSettings): Promise<boolean> {
+    const issues = this.validateSettings(settings);
+    if (issues.length > 0) {
+      console.warn('Settings validation warnings:', issues);
+    }
+    
+    // Writes are serialized through a single async drain loop; saves that
+    // arrive while one is in flight only replace the pending payload, so a
+    // burst of saves costs at most one extra write of the newest settings
+    this.queuedSettings = settings;
+    this.pendingSettings = settings;
+    if (!this.activeWrite) {
+      this.activeWrite = this.drainPendingWrites();
+    }
+    return this.activeWrite;
+  }
+  
+  private async drainPendingWrites(): Promise<boolean> {
+    /** Write queued settings until none are left; resolves with the last write's result. */
+    let saved = false;
+    while (this.pendingSettings) {
+      const settings = this.pendingSettings;
+      this.pendingSettings = null;
+      try {
+        // Write to a temporary file and rename it over settings.json, so a
+        // crash mid-write can't leave a truncated file that loads as defaults
+        const tempFile = `${this.settingsFile}.tmp`;
+        await fs.promises.writeFile(tempFile, JSON.stringify(settings, null, 2), 'utf8');
+        await fs.promises.rename(tempFile, this.settingsFile);
+        console.log('Settings saved to', this.settingsFile);
+        saved = true;
+      } catch (error) {
+        console.error('Failed to save settings:', error);
+        saved = false;
       }
-      
-      fs.writeFileSync(this.settingsFile, JSON.stringify(settings, null, 2), 'utf8');
-      console.log('Settings saved to', this.settingsFile);
-      return true;
-    } catch (error) {
-      console.error('Failed to save settings:', error);
-      return false;
     }
+    this.activeWrite = null;
+    this.queuedSettings = null;
+    return saved;
+  }
+  
+  get pendingWrite(): Promise<boolean> | null {
+    /** The settings write in flight, or null once everything is on disk. */
+    return this.activeWrite;
   }
   
   validateSettings(settings: AppSettings): string[] {
@@ -729,6 +905,33 @@ const settingsManager = new SettingsManager();
 // RENDER MANAGEMENT
 // ============================================================================
 
+function initRenderPaths(): RenderPaths {
+  /**
+   * Resolve the DAZ Studio executable, render script and template paths.
+   * None of these change while Overlord is running, so they are computed
+   * once at startup and reused by every render.
+   */
+  const programFiles = process.env.ProgramFiles || 'C:\\Program Files';
+  
+  renderPaths = {
+    dazExecutable: path.join(programFiles, 'DAZ 3D', 'DAZStudio4', 'DAZStudio.exe'),
+    renderScript: toForwardSlashes(resourcePath(path.join('scripts', 'masterRenderer.dsa'))),
+    template: toForwardSlashes(resourcePath(path.join('templates', 'masterTemplate.duf')))
+  };
+  
+  console.log(`Render paths resolved: DAZ Studio ${normalizePathForLogging(renderPaths.dazExecutable)}, script ${renderPaths.renderScript}, template ${renderPaths.template}`);
+  return renderPaths;
+}
+
+// Settings holding lists of input files, with the name used in validation
+// errors and whether a 'static' line (render without animation) is allowed
+const OPTIONAL_FILE_LISTS: ['animations' | 'prop_animations' | 'gear' | 'gear_animations', string, boolean][] = [
+  ['animations', 'Animation file', true],
+  ['prop_animations', 'Prop animation file', false],
+  ['gear', 'Gear file', false],
+  ['gear_animations', 'Gear animation file', false]
+];
+
 async function startRender(settings: AppSettings): Promise<RenderResult> {
   // Validate input files exist
   const filesToValidate: FileToValidate[] = [];
@@ -739,38 +942,11 @@ async function startRender(settings: AppSettings): Promise<RenderResult> {
   }
   filesToValidate.push({ path: settings.subject, name: 'Subject file' });
   
-  // Animation files (optional - renders as static if none provided)
-  if (settings.animations) {
-    settings.animations.forEach((anim, idx) => {
-      if (anim && anim.trim() && anim !== 'static') {
-        filesToValidate.push({ path: anim, name: `Animation file ${idx + 1}` });
-      }
-    });
-  }
-  
-  // Optional prop animations
-  if (settings.prop_animations) {
-    settings.prop_animations.forEach((propAnim, idx) => {
-      if (propAnim && propAnim.trim()) {
-        filesToValidate.push({ path: propAnim, name: `Prop animation file ${idx + 1}` });
-      }
-    });
-  }
-  
-  // Optional gear files
-  if (settings.gear) {
-    settings.gear.forEach((gear, idx) => {
-      if (gear && gear.trim()) {
-        filesToValidate.push({ path: gear, name: `Gear file ${idx + 1}` });
-      }
-    });
-  }
-  
-  // Optional gear animations
-  if (settings.gear_animations) {
-    settings.gear_animations.forEach((gearAnim, idx) => {
-      if (gearAnim && gearAnim.trim()) {
-        filesToValidate.push({ path: gearAnim, name: `Gear animation file ${idx + 1}` });
+  // Optional file lists; animations render as static if none are provided
+  for (const [key, label, allowStatic] of OPTIONAL_FILE_LISTS) {
+    (settings[key] || []).forEach((filePath, idx) => {
+      if (filePath && filePath.trim() && !(allowStatic && filePath === 'static')) {
+        filesToValidate.push({ path: filePath, name: `${label} ${idx + 1}` });
       }
     });
   }
@@ -803,50 +979,38 @@ async function startRender(settings: AppSettings): Promise<RenderResult> {
     settings.render_shadows
   );
   
-  const appDataDir = getLocalAppDataPath();
-  const resultsDir = path.join(appDataDir, 'IrayServer', 'results', 'admin');
+  const resultsDir = IRAY_RESULTS_DIRECTORY;
   const finalOutputDir = settings.output_directory;
   
   // Count existing images at session start
   sessionStartImageCount = countImagesInDirectory(finalOutputDir);
   
-  // Create directories
-  if (!fs.existsSync(resultsDir)) {
-    fs.mkdirSync(resultsDir, { recursive: true });
-  }
-  if (!fs.existsSync(finalOutputDir)) {
-    fs.mkdirSync(finalOutputDir, { recursive: true });
-  }
+  // Create directories. These can be deleted between renders (Iray Server
+  // cleanup removes the results folder), so they're not cached; a recursive
+  // mkdir is already a no-op when the folder exists.
+  fs.mkdirSync(resultsDir, { recursive: true });
+  fs.mkdirSync(finalOutputDir, { recursive: true });
   
   console.log('Skipping Iray Server startup - will be handled by DAZ Script');
   
   // Prepare file paths
-  const subjectFile = settings.subject.replace(/\\/g, '/');
-  const animations = settings.animations.map(a => a.replace(/\\/g, '/'));
-  const propAnimations = (settings.prop_animations || []).map(a => a.replace(/\\/g, '/'));
-  const gear = (settings.gear || []).map(g => g.replace(/\\/g, '/'));
-  const gearAnimations = (settings.gear_animations || []).map(a => a.replace(/\\/g, '/'));
+  const subjectFile = toForwardSlashes(settings.subject);
+  const animations = toForwardSlashesAll(settings.animations);
+  const propAnimations = toForwardSlashesAll(settings.prop_animations);
+  const gear = toForwardSlashesAll(settings.gear);
+  const gearAnimations = toForwardSlashesAll(settings.gear_animations);
   
-  // Get DAZ executable path
-  const programFiles = process.env.ProgramFiles || 'C:\\Program Files';
-  const dazExecutablePath = path.join(programFiles, 'DAZ 3D', 'DAZStudio4', 'DAZStudio.exe');
-  
-  // Get template and script paths
-  let renderScriptPath: string;
-  let templatePath: string;
-  
-  if (app.isPackaged) {
-    renderScriptPath = path.join(process.resourcesPath, 'app', 'scripts', 'masterRenderer.dsa').replace(/\\/g, '/');
-    templatePath = path.join(process.resourcesPath, 'app', 'templates', 'masterTemplate.duf').replace(/\\/g, '/');
-  } else {
-    renderScriptPath = path.join(__dirname, 'scripts', 'masterRenderer.dsa').replace(/\\/g, '/');
-    templatePath = path.join(__dirname, 'templates', 'masterTemplate.duf').replace(/\\/g, '/');
-  }
+  // DAZ executable, template and script paths are resolved once per session
+  const {
+    dazExecutable: dazExecutablePath,
+    renderScript: renderScriptPath,
+    template: templatePath
+  } = renderPaths || initRenderPaths();
   
   // Create JSON map for DAZ Studio
   const jsonMap: RenderJsonMap = {
     num_instances: settings.number_of_instances.toString(),
-    image_output_dir: finalOutputDir.replace(/\\/g, '/'),
+    image_output_dir: toForwardSlashes(finalOutputDir),
     frame_rate: settings.frame_rate.toString(),
     subject_file: subjectFile,
     animations: animations,
@@ -855,7 +1019,7 @@ async function startRender(settings: AppSettings): Promise<RenderResult> {
     gear_animations: gearAnimations,
     template_path: templatePath,
     render_shadows: settings.render_shadows,
-    results_directory_path: resultsDir.replace(/\\/g, '/'),
+    results_directory_path: toForwardSlashes(resultsDir),
     cache_db_size_threshold_gb: settings.cache_db_size_threshold_gb.toString()
   };
   
@@ -870,29 +1034,37 @@ async function startRender(settings: AppSettings): Promise<RenderResult> {
   const jsonMapStr = JSON.stringify(jsonMap);
   const numInstances = parseInt(settings.number_of_instances);
   
-  // Launch DAZ Studio instances
-  for (let i = 0; i < numInstances; i++) {
-    const command: string[] = [
-      '-scriptArg', jsonMapStr,
-      '-instanceName', '#',
-      '-logSize', LOG_SIZE_DAZ,
-    ];
-    
-    if (settings.hide_daz_instances) {
-      command.push('-headless');
-    }
-    
-    command.push('-noPrompt', renderScriptPath);
-    
-    console.log(`Launching DAZ Studio instance ${i + 1}/${numInstances}`);
-    spawn(dazExecutablePath, command, { detached: true, stdio: 'ignore' });
-    
-    if (i < numInstances - 1) {
-      await new Promise<void>(resolve => setTimeout(resolve, 5000));
-    }
+  // Every instance gets the same arguments, so build them once
+  const command: string[] = [
+    '-scriptArg', jsonMapStr,
+    '-instanceName', '#',
+    '-logSize', LOG_SIZE_DAZ,
+  ];
+  
+  if (settings.hide_daz_instances) {
+    command.push('-headless');
   }
   
-  console.log('All render instances launched');
+  command.push('-noPrompt', renderScriptPath);
+  
+  // Launch DAZ Studio instances, staggered so they don't all load at once.
+  // Launches are scheduled rather than awaited, so the render call
+  // returns right away and stopRender can cancel any still pending.
+  cancelPendingLaunches();
+  
+  const launchInstance = (index: number): void => {
+    console.log(`Launching DAZ Studio instance ${index + 1}/${numInstances}`);
+    // Nothing is read from the instance, so let it run fully independent of
+    // our event loop instead of keeping a handle to it alive
+    spawn(dazExecutablePath, command, { detached: true, stdio: 'ignore' }).unref();
+    if (index === numInstances - 1) {
+      console.log('All render instances launched');
+    }
+  };
+  
+  for (let i = 0; i < numInstances; i++) {
+    pendingLaunchHandles.push(setTimeout(() => launchInstance(i), i * INSTANCE_LAUNCH_STAGGER_MS));
+  }
   
   // Start file monitoring
   startFileMonitoring(finalOutputDir);
@@ -900,8 +1072,16 @@ async function startRender(settings: AppSettings): Promise<RenderResult> {
   return { success: true, message: 'Render started successfully' };
 }
 
+function cancelPendingLaunches(): void {
+  for (const handle of pendingLaunchHandles) {
+    clearTimeout(handle);
+  }
+  pendingLaunchHandles = [];
+}
+
 async function stopRender(): Promise<RenderResult> {
   isRendering = false;
+  cancelPendingLaunches();
   stopFileMonitoring();
   await stopAllRenderProcesses();
   return { success: true, message: 'Render stopped successfully' };
@@ -912,28 +1092,46 @@ async function stopRender(): Promise<RenderResult> {
 // ============================================================================
 
 function countImagesInDirectory(directory: string): number {
+  /**
+   * Count the images under a directory. A folder's mtime only changes when
+   * entries are added, removed or renamed in it, so folders whose mtime
+   * matches the cached one reuse their count and subfolder list; a progress
+   * tick then costs one stat per folder rather than a listing of every frame.
+   * Like git's racily-clean check, a listing taken while the folder's mtime
+   * was still recent is not reused, since a later write may share that mtime.
+   */
   let count = 0;
   
   function walkDir(dir: string): void {
     try {
-      const files = fs.readdirSync(dir);
+      const mtimeMs = fs.statSync(dir).mtimeMs;
+      let cached = directoryImageCounts.get(dir);
       
-      for (const file of files) {
-        const filePath = path.join(dir, file);
-        try {
-          const stat = fs.statSync(filePath);
-          
-          if (stat.isDirectory()) {
-            walkDir(filePath);
-          } else if (IMAGE_EXTENSIONS.some(ext => file.toLowerCase().endsWith(ext))) {
-            count++;
+      if (!cached || cached.mtimeMs !== mtimeMs || mtimeMs > cached.listedAt - IMAGE_COUNT_MTIME_MARGIN_MS) {
+        const listedAt = Date.now();
+        // Directory entries carry their type, so counting needs no per-file stat
+        const entries = fs.readdirSync(dir, { withFileTypes: true });
+        cached = { mtimeMs: mtimeMs, listedAt: listedAt, imageCount: 0, subdirectories: [] };
+        
+        for (const entry of entries) {
+          const entryPath = path.join(dir, entry.name);
+          if (isDirectoryEntry(entry, entryPath)) {
+            cached.subdirectories.push(entryPath);
+          } else if (isImageFile(entry.name)) {
+            cached.imageCount++;
           }
-        } catch (error) {
-          // Ignore inaccessible files
         }
+        
+        directoryImageCounts.set(dir, cached);
+      }
+      
+      count += cached.imageCount;
+      for (const subdirectory of cached.subdirectories) {
+        walkDir(subdirectory);
       }
     } catch (error) {
       // Ignore inaccessible directories
+      directoryImageCounts.delete(dir);
     }
   }
   
@@ -941,34 +1139,139 @@ function countImagesInDirectory(directory: string): number {
   return count;
 }
 
+function directoryWatchKey(directory: string): string {
+  const resolved = path.resolve(directory);
+  return process.platform === 'win32' ? resolved.toLowerCase() : resolved;
+}
+
+function watchDirectory(directory: string, listener: () => void): (() => void) | null {
+  /**
+   * Subscribe to changes anywhere under a directory. Every subscriber shares a
+   * single recursive watcher, and a burst of events (writing a frame raises
+   * several) is collapsed into one notification after a short quiet period.
+   * Returns an unsubscribe function, or null if the directory can't be watched,
+   * in which case callers rely on their polling fallback.
+   */
+  const key = directoryWatchKey(directory);
+  let entry = directoryWatches.get(key);
+  
+  if (!entry) {
+    let watcher: fs.FSWatcher;
+    try {
+      watcher = fs.watch(path.resolve(directory), { recursive: true });
+    } catch (error) {
+      const err = error as Error;
+      console.warn(`Could not watch ${normalizePathForLogging(directory)} for changes, polling only: ${err.message}`);
+      return null;
+    }
+    
+    const newEntry: DirectoryWatch = { watcher, listeners: new Set(), debounceHandle: null };
+    
+    watcher.on('change', () => {
+      if (newEntry.debounceHandle) {
+        clearTimeout(newEntry.debounceHandle);
+      }
+      newEntry.debounceHandle = setTimeout(() => {
+        newEntry.debounceHandle = null;
+        for (const notify of newEntry.listeners) {
+          notify();
+        }
+      }, OUTPUT_WATCH_DEBOUNCE_MS);
+    });
+    
+    watcher.on('error', (error: Error) => {
+      console.warn(`Watcher for ${normalizePathForLogging(directory)} failed, falling back to polling: ${error.message}`);
+      closeDirectoryWatch(key, newEntry);
+    });
+    
+    directoryWatches.set(key, newEntry);
+    entry = newEntry;
+  }
+  
+  const watch = entry;
+  watch.listeners.add(listener);
+  
+  return () => {
+    watch.listeners.delete(listener);
+    if (watch.listeners.size === 0) {
+      closeDirectoryWatch(key, watch);
+    }
+  };
+}
+
+function isWatchingDirectory(directory: string, listener: () => void): boolean {
+  /**
+   * Whether a listener is still subscribed to a live watcher. Watchers that
+   * fail are closed, which silently drops their listeners.
+   */
+  const watch = directoryWatches.get(directoryWatchKey(directory));
+  return watch !== undefined && watch.listeners.has(listener);
+}
+
+function closeDirectoryWatch(key: string, watch: DirectoryWatch): void {
+  if (watch.debounceHandle) {
+    clearTimeout(watch.debounceHandle);
+    watch.debounceHandle = null;
+  }
+  watch.watcher.close();
+  if (directoryWatches.get(key) === watch) {
+    directoryWatches.delete(key);
+  }
+}
+
+function formatCompletionTime(completionTime: Date): string {
+  // Format as "Monday, 3:14 PM, February 15th, 2025"
+  const dayOfWeek = completionTime.toLocaleDateString('en-US', { weekday: 'long' });
+  
+  const timeStr = completionTime.toLocaleTimeString('en-US', { 
+    hour: 'numeric', 
+    minute: '2-digit',
+    hour12: true 
+  });
+  
+  const day = completionTime.getDate();
+  const daySuffix = ['th', 'st', 'nd', 'rd'][(day % 10 > 3 || Math.floor(day / 10) === 1) ? 0 : day % 10];
+  
+  const monthStr = completionTime.toLocaleDateString('en-US', { month: 'long' });
+  const yearStr = completionTime.getFullYear();
+  
+  return `${dayOfWeek}, ${timeStr}, ${monthStr} ${day}${daySuffix}, ${yearStr}`;
+}
+
+function showLatestImage(latestImage: ImageFileInfo): void {
+  /**
+   * Send the newest image to the preview, unless it's the one already shown.
+   */
+  if (latestImage.path === currentImagePath) {
+    return;
+  }
+  currentImagePath = latestImage.path;
+  
+  const imageData: ImageData = {
+    path: latestImage.path,
+    filename: path.basename(latestImage.path),
+    size: latestImage.size,
+    created: new Date(latestImage.mtime)
+  };
+  
+  if (mainWindow) {
+    mainWindow.webContents.send('image-updated', imageData);
+  }
+}
+
 function startFileMonitoring(directory: string): void {
   stopFileMonitoring();
+  directoryImageCounts.clear();
+  renderMonitorDirectoryKey = directoryWatchKey(directory);
   
-  fileWatcherHandle = setInterval(() => {
+  let lastProgressCheck = 0;
+  
+  const checkRenderProgress = (): void => {
+    lastProgressCheck = Date.now();
     const images = findNewestImage(directory);
     
-    if (images && images.length > 0) {
-      const latestImage = images[0];
-      
-      if (latestImage !== currentImagePath) {
-        currentImagePath = latestImage;
-        
-        try {
-          const stats = fs.statSync(latestImage);
-          const imageData: ImageData = {
-            path: latestImage,
-            filename: path.basename(latestImage),
-            size: stats.size,
-            created: stats.mtime
-          };
-          
-          if (mainWindow) {
-            mainWindow.webContents.send('image-updated', imageData);
-          }
-        } catch (error) {
-          console.error('Error getting image stats:', error);
-        }
-      }
+    if (images.length > 0) {
+      showLatestImage(images[0]);
     }
     
     // Count total images and send progress update
@@ -984,23 +1287,7 @@ function startFileMonitoring(directory: string): void {
         if (avgRenderTime && avgRenderTime > 0) {
           const totalSecondsRemaining = remaining * avgRenderTime;
           const completionTime = new Date(Date.now() + (totalSecondsRemaining * 1000));
-          
-          // Format as "Monday, 3:14 PM, February 15th, 2025"
-          const dayOfWeek = completionTime.toLocaleDateString('en-US', { weekday: 'long' });
-          
-          const timeStr = completionTime.toLocaleTimeString('en-US', { 
-            hour: 'numeric', 
-            minute: '2-digit',
-            hour12: true 
-          });
-          
-          const day = completionTime.getDate();
-          const daySuffix = ['th', 'st', 'nd', 'rd'][(day % 10 > 3 || Math.floor(day / 10) === 1) ? 0 : day % 10];
-          
-          const monthStr = completionTime.toLocaleDateString('en-US', { month: 'long' });
-          const yearStr = completionTime.getFullYear();
-          
-          estimatedCompletion = `${dayOfWeek}, ${timeStr}, ${monthStr} ${day}${daySuffix}, ${yearStr}`;
+          estimatedCompletion = formatCompletionTime(completionTime);
         } else {
           estimatedCompletion = 'Calculating...';
         }
@@ -1020,14 +1307,48 @@ function startFileMonitoring(directory: string): void {
       
       mainWindow.webContents.send('render-progress', progress);
     }
-  }, 2000);
+  };
+  
+  // Poll every 2 seconds as a fallback for file systems that don't deliver
+  // change notifications. While the watcher is live it reports every new
+  // frame, so the poll only rescans every RENDER_PROGRESS_REFRESH_MS, and
+  // otherwise just rebinds a failed watcher.
+  const pollRenderProgress = (): void => {
+    if (isWatchingDirectory(directory, checkRenderProgress)) {
+      if (Date.now() - lastProgressCheck >= RENDER_PROGRESS_REFRESH_MS) {
+        checkRenderProgress();
+      }
+      return;
+    }
+    
+    if (unwatchRenderOutput) {
+      unwatchRenderOutput();
+    }
+    unwatchRenderOutput = watchDirectory(directory, checkRenderProgress);
+    
+    checkRenderProgress();
+  };
+  
+  fileWatcherHandle = setInterval(pollRenderProgress, 2000);
+  
+  // React to new images as soon as the OS reports them
+  unwatchRenderOutput = watchDirectory(directory, checkRenderProgress);
+  
+  // Fill in the progress panel now rather than waiting for the first frame
+  checkRenderProgress();
 }
 
 function stopFileMonitoring(): void {
+  directoryImageCounts.clear();
+  renderMonitorDirectoryKey = null;
   if (fileWatcherHandle) {
     clearInterval(fileWatcherHandle);
     fileWatcherHandle = null;
   }
+  if (unwatchRenderOutput) {
+    unwatchRenderOutput();
+    unwatchRenderOutput = null;
+  }
 }
 
 function startContinuousImageMonitoring(outputDirectory: string): void {
@@ -1035,8 +1356,13 @@ function startContinuousImageMonitoring(outputDirectory: string): void {
     return;
   }
   
-  // Monitor for newest image every 5 seconds
   const checkForNewestImage = (): void => {
+    // The render monitor already updates the preview when it is watching this
+    // same directory, so don't walk the tree a second time
+    if (renderMonitorDirectoryKey === directoryWatchKey(outputDirectory)) {
+      return;
+    }
+    
     // Check if directory exists
     if (!fs.existsSync(outputDirectory)) {
       if (currentImagePath !== null && mainWindow) {
@@ -1048,28 +1374,8 @@ function startContinuousImageMonitoring(outputDirectory: string): void {
     
     const images = findNewestImage(outputDirectory);
     
-    if (images && images.length > 0) {
-      const latestImage = images[0];
-      
-      if (latestImage !== currentImagePath) {
-        currentImagePath = latestImage;
-        
-        try {
-          const stats = fs.statSync(latestImage);
-          const imageData: ImageData = {
-            path: latestImage,
-            filename: path.basename(latestImage),
-            size: stats.size,
-            created: stats.mtime
-          };
-          
-          if (mainWindow) {
-            mainWindow.webContents.send('image-updated', imageData);
-          }
-        } catch (error) {
-          console.error('Error getting image stats:', error);
-        }
-      }
+    if (images.length > 0) {
+      showLatestImage(images[0]);
     } else if (currentImagePath !== null) {
       // No images found and we previously had an image - send no-images-found event
       currentImagePath = null;
@@ -1079,14 +1385,40 @@ function startContinuousImageMonitoring(outputDirectory: string): void {
     }
   };
   
+  // While the watcher is live it reports every change, so the 5 second poll
+  // only has work to do when the directory couldn't be watched (it may not
+  // exist yet) or the watcher has since failed
+  const pollForNewestImage = (): void => {
+    if (isWatchingDirectory(outputDirectory, checkForNewestImage)) {
+      return;
+    }
+    
+    if (fs.existsSync(outputDirectory)) {
+      if (unwatchContinuousOutput) {
+        unwatchContinuousOutput();
+      }
+      unwatchContinuousOutput = watchDirectory(outputDirectory, checkForNewestImage);
+    }
+    
+    checkForNewestImage();
+  };
+  
   // Check immediately
   checkForNewestImage();
   
-  // Then check every 5 seconds
   if (periodicMonitoringHandle) {
     clearInterval(periodicMonitoringHandle);
   }
-  periodicMonitoringHandle = setInterval(checkForNewestImage, 5000);
+  periodicMonitoringHandle = setInterval(pollForNewestImage, 5000);
+  
+  // and whenever the directory changes, sharing the render monitor's watcher
+  // when both are looking at the same directory
+  if (unwatchContinuousOutput) {
+    unwatchContinuousOutput();
+  }
+  unwatchContinuousOutput = fs.existsSync(outputDirectory)
+    ? watchDirectory(outputDirectory, checkForNewestImage)
+    : null;
 }
 
 function stopContinuousImageMonitoring(): void {
@@ -1094,6 +1426,10 @@ function stopContinuousImageMonitoring(): void {
     clearInterval(periodicMonitoringHandle);
     periodicMonitoringHandle = null;
   }
+  if (unwatchContinuousOutput) {
+    unwatchContinuousOutput();
+    unwatchContinuousOutput = null;
+  }
 }
 
 // ============================================================================
@@ -1136,54 +1472,47 @@ function createSplashScreen(): void {
       }
     });
     
-    // Check if splash image exists
+    // Read the splash image directly rather than checking for it first;
+    // a missing file throws and falls back to the text splash
     const splashImagePath = resourcePath(path.join('images', 'splashScreen.webp'));
-    let hasSplashImage = false;
+    let hasSplashImage = true;
     
+    let splashHTML: string;
     try {
-      hasSplashImage = fs.existsSync(splashImagePath);
+      // Use image splash - no text, no border
+      const imageData = fs.readFileSync(splashImagePath);
+      const base64Image = imageData.toString('base64');
+      splashHTML = `
+        <!DOCTYPE html>
+        <html>
+        <head>
+          <meta charset="UTF-8">
+          <style>
+            * { margin: 0; padding: 0; }
+            body {
+              width: 100vw;
+              height: 100vh;
+              display: flex;
+              align-items: center;
+              justify-content: center;
+              background: transparent;
+              overflow: hidden;
+            }
+            .splash-image {
+              max-width: 100%;
+              max-height: 100%;
+              object-fit: contain;
+            }
+          </style>
+        </head>
+        <body>
+          <img src="data:image/webp;base64,${base64Image}" class="splash-image" alt="Overlord">
+        </body>
+        </html>
+      `;
     } catch (error) {
-      console.warn('Could not check for splash image:', error);
-    }
-    
-    let splashHTML: string;
-    if (hasSplashImage) {
-      try {
-        // Use image splash - no text, no border
-        const imageData = fs.readFileSync(splashImagePath);
-        const base64Image = imageData.toString('base64');
-        splashHTML = `
-          <!DOCTYPE html>
-          <html>
-          <head>
-            <meta charset="UTF-8">
-            <style>
-              * { margin: 0; padding: 0; }
-              body {
-                width: 100vw;
-                height: 100vh;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                background: transparent;
-                overflow: hidden;
-              }
-              .splash-image {
-                max-width: 100%;
-                max-height: 100%;
-                object-fit: contain;
-              }
-            </style>
-          </head>
-          <body>
-            <img src="data:image/webp;base64,${base64Image}" class="splash-image" alt="Overlord">
-          </body>
-          </html>
-        `;
-      } catch (error) {
-        console.warn('Failed to load splash image, using fallback:', error);
-        hasSplashImage = false;
-      }
+      console.warn('Failed to load splash image, using fallback:', error);
+      hasSplashImage = false;
     }
     
     if (!hasSplashImage) {
@@ -1235,7 +1564,6 @@ function createSplashScreen(): void {
     splashWindow.center();
     splashWindow.once('ready-to-show', () => {
       splashWindow!.show();
-      splashStartTime = Date.now(); // Track when splash was shown
     });
   } catch (error) {
     console.error('Failed to create splash screen:', error);
@@ -1285,42 +1613,34 @@ function createWindow(): void {
     
     // Apply theme after page loads
     mainWindow.webContents.on('did-finish-load', () => {
-      const themeClass = currentTheme === 'light' ? 'theme-light' : 'theme-dark';
-      mainWindow!.webContents.executeJavaScript(`document.body.className = '${themeClass}';`);
+      mainWindow!.webContents.executeJavaScript(THEME_BODY_CLASS_SCRIPTS[currentTheme]);
     });
     
     mainWindow.once('ready-to-show', () => {
-      // Ensure splash screen is shown for at least 1 second
-      const minSplashTime = 1000; // 1 second
-      const elapsed = splashStartTime ? Date.now() - splashStartTime : 0;
-      const remainingTime = Math.max(0, minSplashTime - elapsed);
+      // Close splash screen as soon as the main window can paint
+      if (splashWindow) {
+        splashWindow.close();
+        splashWindow = null;
+      }
       
-      setTimeout(() => {
-        // Close splash screen
-        if (splashWindow) {
-          splashWindow.close();
-          splashWindow = null;
-        }
-        
-        mainWindow!.show();
-        mainWindow!.maximize();
-        
-        // Start continuous image monitoring with current output directory
-        try {
-          const settings = settingsManager.loadSettings();
-          if (settings.output_directory) {
-            startContinuousImageMonitoring(settings.output_directory);
-          }
-        } catch (error) {
-          console.error('Error starting continuous monitoring:', error);
-        }
-        
-        // Check for auto-start
-        const autoStart = process.argv.includes('--startRender');
-        if (autoStart) {
-          mainWindow!.webContents.executeJavaScript('if (window.autoStartRender) window.autoStartRender();');
+      mainWindow!.show();
+      mainWindow!.maximize();
+      
+      // Start continuous image monitoring with current output directory
+      try {
+        const settings = settingsManager.loadSettings();
+        if (settings.output_directory) {
+          startContinuousImageMonitoring(settings.output_directory);
         }
-      }, remainingTime);
+      } catch (error) {
+        console.error('Error starting continuous monitoring:', error);
+      }
+      
+      // Check for auto-start
+      const autoStart = process.argv.includes('--startRender');
+      if (autoStart) {
+        mainWindow!.webContents.executeJavaScript('if (window.autoStartRender) window.autoStartRender();');
+      }
     });
     
     mainWindow.on('minimize', () => {
@@ -1411,13 +1731,13 @@ function createTray(): void {
 ipcMain.handle('load-settings', () => {
   console.log('IPC: load-settings called');
   const settings = settingsManager.loadSettings();
-  console.log('IPC: Returning settings:', JSON.stringify(settings, null, 2));
+  console.log('IPC: Returning settings:', JSON.stringify(settings));
   return settings;
 });
 
-ipcMain.handle('save-settings', (_event: Electron.IpcMainInvokeEvent, settings: AppSettings) => {
-  console.log('IPC: save-settings called with:', JSON.stringify(settings, null, 2));
-  const result = settingsManager.saveSettings(settings);
+ipcMain.handle('save-settings', async (_event: Electron.IpcMainInvokeEvent, settings: AppSettings) => {
+  console.log('IPC: save-settings called with:', JSON.stringify(settings));
+  const result = await settingsManager.saveSettings(settings);
   console.log('IPC: Save result:', result);
   
   // Start monitoring the output directory for newest image
@@ -1675,21 +1995,20 @@ process.on('unhandledRejection', (reason: unknown, promise: Promise<unknown>) =>
 app.whenReady().then(() => {
   try {
     setupLogger();
+    initRenderPaths();
     
     // Show splash screen first
     createSplashScreen();
     
-    // Create main window after a short delay to ensure splash is visible
-    setTimeout(() => {
-      try {
-        createWindow();
-        createTray();
-      } catch (error) {
-        const err = error as Error;
-        console.error('Error creating main window or tray:', err);
-        dialog.showErrorBox('Startup Error', `Failed to create application window:\n\n${err.message}`);
-      }
-    }, 500);
+    // Create the main window right away; it loads behind the splash
+    try {
+      createWindow();
+      createTray();
+    } catch (error) {
+      const err = error as Error;
+      console.error('Error creating main window or tray:', err);
+      dialog.showErrorBox('Startup Error', `Failed to create application window:\n\n${err.message}`);
+    }
     
     app.on('activate', () => {
       if (BrowserWindow.getAllWindows().length === 0) {
@@ -1714,7 +2033,15 @@ app.on('window-all-closed', () => {
   }
 });
 
-app.on('before-quit', () => {
+app.on('before-quit', (event: Electron.Event) => {
+  // Hold the quit until the last settings write has landed on disk
+  const pendingWrite = settingsManager.pendingWrite;
+  if (pendingWrite) {
+    event.preventDefault();
+    pendingWrite.finally(() => app.quit());
+    return;
+  }
+  
   try {
     stopFileMonitoring();
     stopContinuousImageMonitoring();
@@ -1731,9 +2058,8 @@ nativeTheme.on('updated', () => {
   try {
     currentTheme = detectWindowsTheme();
     if (mainWindow) {
-      // Reload the page and apply the new theme
-      const themeClass = currentTheme === 'light' ? 'theme-light' : 'theme-dark';
-      mainWindow.webContents.executeJavaScript(`document.body.className = '${themeClass}';`);
+      // Apply the new theme
+      mainWindow.webContents.executeJavaScript(THEME_BODY_CLASS_SCRIPTS[currentTheme]);
     }
   } catch (error) {
     console.error('Error updating theme:', error);
@@ -2,6 +2,7 @@ const { ipcRenderer, shell } = require('electron') as typeof import('electron');
 const path = require('path') as typeof import('path');
 const fs = require('fs') as typeof import('fs');
 const os = require('os') as typeof import('os');
+const { pathToFileURL } = require('url') as typeof import('url');
 
 // ============================================================================
 // TYPES AND INTERFACES
@@ -108,25 +109,51 @@ function getSettings(): AppSettings {
   };
 }
 
+// Serialized form of the last settings written, so unchanged saves can be skipped
+let lastSavedSettingsJson: string | null = null;
+
 async function saveSettings(): Promise<void> {
+  const settings = getSettings();
+  const settingsJson = JSON.stringify(settings);
+  if (settingsJson === lastSavedSettingsJson) {
+    return;
+  }
+  
+  // Claim the content before the round trip so a save fired right behind
+  // this one (change then blur) is skipped instead of sent twice
+  lastSavedSettingsJson = settingsJson;
+  let saved = false;
   try {
-    const settings = getSettings();
     console.log('Saving settings:', settings);
-    await ipcRenderer.invoke('save-settings', settings);
-    console.log('Settings saved successfully');
+    saved = await ipcRenderer.invoke('save-settings', settings);
+    if (saved) {
+      console.log('Settings saved successfully');
+    } else {
+      console.error('Error saving settings: the settings file could not be written');
+    }
   } catch (error) {
     console.error('Error saving settings:', error);
   }
+  
+  // Let a failed save be retried, unless a newer save has claimed the memo since
+  if (!saved && lastSavedSettingsJson === settingsJson) {
+    lastSavedSettingsJson = null;
+  }
 }
 
 // Auto-save debounced
 let saveTimeout: ReturnType<typeof setTimeout>;
 function autoSave(): void {
-  console.log('autoSave() called - will save in 500ms');
   clearTimeout(saveTimeout);
   saveTimeout = setTimeout(saveSettings, 500);
 }
 
+// Save right away once an edit is committed (change/blur), replacing any pending auto-save
+function flushSave(): void {
+  clearTimeout(saveTimeout);
+  saveSettings();
+}
+
 // Clamp number inputs to valid ranges
 function clampNumberInputs(): void {
   const instances = document.getElementById('instances') as HTMLInputElement;
@@ -179,9 +206,9 @@ window.addEventListener('DOMContentLoaded', () => {
   const inputs = document.querySelectorAll('input, textarea');
   console.log(`Found ${inputs.length} input/textarea elements to attach listeners to`);
   inputs.forEach(el => {
-    el.addEventListener('change', autoSave);
     el.addEventListener('input', autoSave);
-    el.addEventListener('blur', autoSave);
+    el.addEventListener('change', flushSave);
+    el.addEventListener('blur', flushSave);
     const inputEl = el as HTMLInputElement;
     console.log(`Attached listeners to: ${inputEl.id || inputEl.name || inputEl.tagName}`);
   });
@@ -212,45 +239,22 @@ async function browseSubject(): Promise<void> {
   }
 }
 
-async function browseAnimations(): Promise<void> {
-  const result: string[] | undefined = await ipcRenderer.invoke('browse-files', { filters: [{ name: 'DAZ Files', extensions: ['duf'] }] });
-  if (result && result.length) {
-    const currentValue = (document.getElementById('animations') as HTMLTextAreaElement).value.trim();
-    const newFiles = currentValue ? currentValue + '\n' + result.join('\n') : result.join('\n');
-    (document.getElementById('animations') as HTMLTextAreaElement).value = newFiles;
-    autoSave();
-  }
-}
-
-async function browsePropAnimations(): Promise<void> {
-  const result: string[] | undefined = await ipcRenderer.invoke('browse-files', { filters: [{ name: 'DAZ Files', extensions: ['duf'] }] });
-  if (result && result.length) {
-    const currentValue = (document.getElementById('prop-animations') as HTMLTextAreaElement).value.trim();
-    const newFiles = currentValue ? currentValue + '\n' + result.join('\n') : result.join('\n');
-    (document.getElementById('prop-animations') as HTMLTextAreaElement).value = newFiles;
-    autoSave();
-  }
-}
-
-async function browseGear(): Promise<void> {
+// DAZ file lists, one path per line
+async function browseFileList(textareaId: string): Promise<void> {
   const result: string[] | undefined = await ipcRenderer.invoke('browse-files', { filters: [{ name: 'DAZ Files', extensions: ['duf'] }] });
   if (result && result.length) {
-    const currentValue = (document.getElementById('gear') as HTMLTextAreaElement).value.trim();
-    const newFiles = currentValue ? currentValue + '\n' + result.join('\n') : result.join('\n');
-    (document.getElementById('gear') as HTMLTextAreaElement).value = newFiles;
+    const textarea = document.getElementById(textareaId) as HTMLTextAreaElement;
+    const currentValue = textarea.value.trim();
+    textarea.value = currentValue ? currentValue + '\n' + result.join('\n') : result.join('\n');
     autoSave();
   }
 }
 
-async function browseGearAnimations(): Promise<void> {
-  const result: string[] | undefined = await ipcRenderer.invoke('browse-files', { filters: [{ name: 'DAZ Files', extensions: ['duf'] }] });
-  if (result && result.length) {
-    const currentValue = (document.getElementById('gear-animations') as HTMLTextAreaElement).value.trim();
-    const newFiles = currentValue ? currentValue + '\n' + result.join('\n') : result.join('\n');
-    (document.getElementById('gear-animations') as HTMLTextAreaElement).value = newFiles;
-    autoSave();
-  }
-}
+// Entry points for index.html's onclick handlers
+function browseAnimations(): Promise<void> { return browseFileList('animations'); }
+function browsePropAnimations(): Promise<void> { return browseFileList('prop-animations'); }
+function browseGear(): Promise<void> { return browseFileList('gear'); }
+function browseGearAnimations(): Promise<void> { return browseFileList('gear-animations'); }
 
 async function browseOutputDir(): Promise<void> {
   const result: string | undefined = await ipcRenderer.invoke('browse-directory');
@@ -264,25 +268,15 @@ async function browseOutputDir(): Promise<void> {
 // CLEAR FUNCTIONS
 // ============================================================================
 
-function clearAnimations(): void {
-  (document.getElementById('animations') as HTMLTextAreaElement).value = '';
-  autoSave();
-}
-
-function clearPropAnimations(): void {
-  (document.getElementById('prop-animations') as HTMLTextAreaElement).value = '';
-  autoSave();
-}
-
-function clearGear(): void {
-  (document.getElementById('gear') as HTMLTextAreaElement).value = '';
+function clearFileList(textareaId: string): void {
+  (document.getElementById(textareaId) as HTMLTextAreaElement).value = '';
   autoSave();
 }
 
-function clearGearAnimations(): void {
-  (document.getElementById('gear-animations') as HTMLTextAreaElement).value = '';
-  autoSave();
-}
+function clearAnimations(): void { clearFileList('animations'); }
+function clearPropAnimations(): void { clearFileList('prop-animations'); }
+function clearGear(): void { clearFileList('gear'); }
+function clearGearAnimations(): void { clearFileList('gear-animations'); }
 
 // ============================================================================
 // RENDER CONTROLS
@@ -484,6 +478,7 @@ async function onSettingChange(key: string, value: boolean): Promise<void> {
   const settings: AppSettings = await ipcRenderer.invoke('load-settings');
   settings[key] = value;
   await ipcRenderer.invoke('save-settings', settings);
+  lastSavedSettingsJson = null; // The file no longer matches the last auto-save
   
   // If it's the startup setting, also update Windows registry
   if (key === 'start_on_startup') {
@@ -548,28 +543,32 @@ function showIrayServerInterface(): void {
 // ABOUT DIALOG
 // ============================================================================
 
-async function showAbout(): Promise<void> {
-  const version: string = await ipcRenderer.invoke('get-version');
-  
-  // Load images as base64
-  let overlordLogoBase64 = '';
-  let vineyardLogoBase64 = '';
-  
-  try {
-    const overlordLogoPath = path.join(process.cwd(), 'images', 'overlordLogo.webp');
-    const overlordLogoBuffer = fs.readFileSync(overlordLogoPath);
-    overlordLogoBase64 = 'data:image/webp;base64,' + overlordLogoBuffer.toString('base64');
-  } catch (error) {
-    console.error('Failed to load Overlord logo:', error);
+// Logo data URLs are read and encoded once, then reused on every reopen
+const logoDataUrlCache = new Map<string, string>();
+
+function loadLogoDataUrl(fileName: string, label: string): string {
+  const cached = logoDataUrlCache.get(fileName);
+  if (cached !== undefined) {
+    return cached;
   }
   
   try {
-    const vineyardLogoPath = path.join(process.cwd(), 'images', 'VineyardTechnologiesLogo.webp');
-    const vineyardLogoBuffer = fs.readFileSync(vineyardLogoPath);
-    vineyardLogoBase64 = 'data:image/webp;base64,' + vineyardLogoBuffer.toString('base64');
+    const logoBuffer = fs.readFileSync(path.join(process.cwd(), 'images', fileName));
+    const dataUrl = 'data:image/webp;base64,' + logoBuffer.toString('base64');
+    logoDataUrlCache.set(fileName, dataUrl);
+    return dataUrl;
   } catch (error) {
-    console.error('Failed to load Vineyard Technologies logo:', error);
+    console.error(`Failed to load ${label}:`, error);
+    return '';
   }
+}
+
+async function showAbout(): Promise<void> {
+  const version: string = await ipcRenderer.invoke('get-version');
+  
+  // Load images as base64 (cached after the first time the dialog opens)
+  const overlordLogoBase64 = loadLogoDataUrl('overlordLogo.webp', 'Overlord logo');
+  const vineyardLogoBase64 = loadLogoDataUrl('VineyardTechnologiesLogo.webp', 'Vineyard Technologies logo');
   
   // Create modal overlay
   const modal = document.createElement('div');
@@ -777,38 +776,52 @@ function formatDateWithDay(date: Date): string {
 ipcRenderer.on('image-updated', (_event: Electron.IpcRendererEvent, imageData: ImageData) => {
   currentImagePath = imageData.path;
   
-  const preview = document.getElementById('image-preview')!;
+  const preview = staticElement('image-preview');
+  
+  // Load the image straight from disk; the file URL lets Chromium read and decode
+  // the PNG itself instead of us reading the whole file and base64-encoding it
+  const showMissingImage = (): void => {
+    preview.innerHTML = '<img src="images/noImagesFound.webp" alt="No images found">';
+    staticElement('info-resolution').textContent = '-';
+  };
   
-  // Read the image file as base64 and display it
   try {
-    const imageBuffer = fs.readFileSync(imageData.path);
-    const base64Image = imageBuffer.toString('base64');
-    const mimeType = 'image/png'; // Always PNG as specified
+    const imageUrl = pathToFileURL(imageData.path);
+    // Frames can be overwritten in place, so key the URL on the file timestamp
+    // to avoid Chromium serving a stale cached copy
+    imageUrl.search = `v=${new Date(imageData.created).getTime()}`;
     
-    // Create an image element to get dimensions
+    // Display the same element we read dimensions from, so the image is only decoded once
     const img = new Image();
+    img.alt = 'Rendered Image';
+    // A newer image may have replaced this one before it finished loading
     img.onload = function() {
-      document.getElementById('info-resolution')!.textContent = `${img.width} × ${img.height}`;
+      if (currentImagePath !== imageData.path) return;
+      staticElement('info-resolution').textContent = `${img.naturalWidth} × ${img.naturalHeight}`;
     };
-    img.src = 'data:' + mimeType + ';base64,' + base64Image;
+    img.onerror = function() {
+      if (currentImagePath !== imageData.path) return;
+      console.error('Error loading image:', imageData.path);
+      showMissingImage();
+    };
+    img.src = imageUrl.href;
     
-    preview.innerHTML = '<img src="data:' + mimeType + ';base64,' + base64Image + '" alt="Rendered Image">';
+    preview.replaceChildren(img);
   } catch (error) {
     console.error('Error loading image:', error);
-    preview.innerHTML = '<img src="images/noImagesFound.webp" alt="No images found">';
-    document.getElementById('info-resolution')!.textContent = '-';
+    showMissingImage();
   }
   
   // Update filename with clickable styling
-  const infoFileElement = document.getElementById('info-file')!;
+  const infoFileElement = staticElement('info-file');
   infoFileElement.textContent = imageData.filename || '-';
   infoFileElement.style.cursor = 'pointer';
   infoFileElement.style.textDecoration = 'underline';
   infoFileElement.style.color = 'var(--select-bg)';
   infoFileElement.onclick = openImageFile;
   
-  document.getElementById('info-size')!.textContent = formatSize(imageData.size) || '-';
-  document.getElementById('info-created')!.textContent = imageData.created ? 
+  staticElement('info-size').textContent = formatSize(imageData.size) || '-';
+  staticElement('info-created').textContent = imageData.created ? 
     formatDateWithDay(new Date(imageData.created)) : '-';
   
   const copyBtn = document.getElementById('copy-btn') as HTMLButtonElement | null;
@@ -820,43 +833,58 @@ ipcRenderer.on('image-updated', (_event: Electron.IpcRendererEvent, imageData: I
 // Listen for render progress updates
 ipcRenderer.on('render-progress', (_event: Electron.IpcRendererEvent, progressData: RenderProgress) => {
   // Update progress bar
-  const progressFill = document.getElementById('progress-fill')!;
+  const progressFill = staticElement('progress-fill');
   progressFill.style.width = progressData.progressPercent.toFixed(1) + '%';
   
   // Update output details
-  document.getElementById('session-images')!.textContent = String(progressData.sessionCount);
-  document.getElementById('total-images')!.textContent = String(progressData.renderedCount);
-  document.getElementById('images-remaining')!.textContent = String(progressData.remaining);
-  document.getElementById('est-completion')!.textContent = progressData.estimatedCompletion;
+  staticElement('session-images').textContent = String(progressData.sessionCount);
+  staticElement('total-images').textContent = String(progressData.renderedCount);
+  staticElement('images-remaining').textContent = String(progressData.remaining);
+  staticElement('est-completion').textContent = progressData.estimatedCompletion;
   
   // Re-enable Start Render button when render is complete
   if (progressData.isComplete) {
-    (document.getElementById('start-btn') as HTMLButtonElement).disabled = false;
+    (staticElement('start-btn') as HTMLButtonElement).disabled = false;
   }
 });
 
 // Listen for no images found event
 ipcRenderer.on('no-images-found', () => {
-  const preview = document.getElementById('image-preview')!;
+  currentImagePath = null;
+  
+  const preview = staticElement('image-preview');
   preview.innerHTML = '<img src="images/noImagesFound.webp" alt="No images found">';
   
   // Reset image info and remove clickable styling
-  const infoFileElement = document.getElementById('info-file')!;
+  const infoFileElement = staticElement('info-file');
   infoFileElement.textContent = '-';
   infoFileElement.style.cursor = 'default';
   infoFileElement.style.textDecoration = 'none';
   infoFileElement.style.color = 'inherit';
   infoFileElement.onclick = null;
   
-  document.getElementById('info-resolution')!.textContent = '-';
-  document.getElementById('info-size')!.textContent = '-';
-  document.getElementById('info-created')!.textContent = '-';
+  staticElement('info-resolution').textContent = '-';
+  staticElement('info-size').textContent = '-';
+  staticElement('info-created').textContent = '-';
 });
 
 // ============================================================================
 // UTILITY FUNCTIONS
 // ============================================================================
 
+// Elements from index.html that live for the whole session, looked up once.
+// Dialog contents are rebuilt on every open and must not go through here.
+const staticElements = new Map<string, HTMLElement>();
+
+function staticElement(id: string): HTMLElement {
+  let element = staticElements.get(id);
+  if (!element) {
+    element = document.getElementById(id)!;
+    staticElements.set(id, element);
+  }
+  return element;
+}
+
 function formatSize(bytes: number): string {
   if (!bytes) return '0 KB';
   if (bytes < 1024 * 1024) {
@@ -949,6 +977,7 @@ async function browseExportDestination(): Promise<void> {
         (currentSettings.last_directories as Record<string, string>).export_destination = path.dirname(directory);
       }
       await ipcRenderer.invoke('save-settings', currentSettings);
+      lastSavedSettingsJson = null;
     }
   } catch (error) {
     console.error('Error browsing for export destination:', error);